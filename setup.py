@@ -7,6 +7,7 @@
 
 import datetime
 import distutils.command.clean
+import filecmp
 import glob
 import importlib.util
 import json
@@ -127,7 +128,11 @@ def get_hip_version(rocm_dir) -> Optional[str]:
 
 def rename_cpp_cu(cpp_files):
     for entry in cpp_files:
-        shutil.copy(entry, os.path.splitext(entry)[0] + ".cu")
+        dst = os.path.splitext(entry)[0] + ".cu"
+        # keep the mtime of unchanged copies so that ninja won't rebuild them
+        if os.path.exists(dst) and filecmp.cmp(entry, dst, shallow=False):
+            continue
+        shutil.copy(entry, dst)
 
 
 def get_extensions():
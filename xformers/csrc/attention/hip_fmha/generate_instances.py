@@ -5,9 +5,12 @@
 # LICENSE file in the root directory of this source tree.
 #
 
+import itertools
 import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from typing import Dict, Tuple
 
 FMHA_COPYRIGHT_HEADER = """
 /*
@@ -24,32 +27,21 @@ FMHA_COPYRIGHT_HEADER = """
     file=os.path.relpath(os.path.realpath(__file__), start=Path(__file__).parents[4])
 )
 
-FMHA_INFER_INSTANCE_TEMPLATE_INC = """
+FMHA_INSTANCE_TEMPLATE_INC = """
 #include <ck_tile/core/numeric/{dtype_file}.hpp>
-#include \"ck_tiled_fmha_{mode}_infer.h\"
+#include \"ck_tiled_fmha_{mode}_{function}.h\"
 """
 
-FMHA_INFER_INSTANCE_TEMPLATE = """
-{extern}template void run_{mode}_infer_mask_bias_dropout_dispatch<
-    {dtype},
-    {has_mask},
-    {has_bias},
-    {has_dropout},
-    {max_k}>({cap_mode}ForwardParams& param, hipStream_t stream);
-"""
+# the instances are only called from within the extension, so they are
+# instantiated with hidden visibility to keep them out of the dynamic symbol
+# table (`#pragma GCC visibility` is not applied to explicit instantiations)
+FMHA_INSTANCE_VISIBILITY = '__attribute__((visibility("hidden"))) '
 
-FMHA_INFER_INSTANCE_FNAME = (
-    "fmha_{mode}_infer_{dtype_str}_{has_or_no_mask_str}_"
-    "{has_or_no_bias_str}_{has_or_no_dropout_str}_{max_k_str}.cpp"
-)
-
-FMHA_FORWARD_INSTANCE_TEMPLATE_INC = """
-#include <ck_tile/core/numeric/{dtype_file}.hpp>
-#include \"ck_tiled_fmha_{mode}_forward.h\"
-"""
+# the instance templates are the explicit instantiations, the reference
+# headers declare the same instantiations prefixed with `extern `
 
-FMHA_FORWARD_INSTANCE_TEMPLATE = """
-{extern}template void run_{mode}_forward_mask_bias_dropout_dispatch<
+# shared by the infer and forward functions, which both take ForwardParams
+FMHA_FORWARD_INSTANCE_TEMPLATE = """template {visibility}void run_{mode}_{function}_mask_bias_dropout_dispatch<
     {dtype},
     {has_mask},
     {has_bias},
@@ -58,17 +50,11 @@ FMHA_FORWARD_INSTANCE_TEMPLATE = """
 """
 
 FMHA_FORWARD_INSTANCE_FNAME = (
-    "fmha_{mode}_forward_{dtype_str}_{has_or_no_mask_str}_"
+    "fmha_{mode}_{function}_{dtype_str}_{has_or_no_mask_str}_"
     "{has_or_no_bias_str}_{has_or_no_dropout_str}_{max_k_str}.cpp"
 )
 
-FMHA_BACKWARD_INSTANCE_TEMPLATE_INC = """
-#include <ck_tile/core/numeric/{dtype_file}.hpp>
-#include \"ck_tiled_fmha_{mode}_backward.h\"
-"""
-
-FMHA_BACKWARD_INSTANCE_TEMPLATE = """
-{extern}template void run_{mode}_backward_mask_bias_dropout_dispatch<
+FMHA_BACKWARD_INSTANCE_TEMPLATE = """template {visibility}void run_{mode}_backward_mask_bias_dropout_dispatch<
     {dtype},
     {has_mask},
     {has_bias},
@@ -123,252 +109,138 @@ MODE_NAME_MAP = {
     "grouped": "Grouped",
 }
 
+MODES = ["batched", "grouped"]
+
+DTYPES = ["fp16", "bf16"]
+
+BOOL_OPTIONS = [True, False]
+
+
+@dataclass(frozen=True)
+class FunctionSpec:
+    template: str
+    fname: str
+    # (has_bias, has_bias_grad) pairs to instantiate
+    bias_options: Tuple[Tuple[bool, bool], ...]
+    # head-dims to instantiate, they must cover the cases dispatched by
+    # FMHA_FWD_HEADDIM_SWITCH and FMHA_BWD_HEADDIM_SWITCH
+    headdims: Tuple[int, ...]
+
+
+FUNCTION_SPEC_MAP = {
+    "infer": FunctionSpec(
+        template=FMHA_FORWARD_INSTANCE_TEMPLATE,
+        fname=FMHA_FORWARD_INSTANCE_FNAME,
+        bias_options=((True, False), (False, False)),
+        headdims=(32, 64, 96, 128, 256, 512),
+    ),
+    "forward": FunctionSpec(
+        template=FMHA_FORWARD_INSTANCE_TEMPLATE,
+        fname=FMHA_FORWARD_INSTANCE_FNAME,
+        bias_options=((True, False), (False, False)),
+        headdims=(32, 64, 96, 128, 256, 512),
+    ),
+    # bias-grad is only supported together with bias
+    "backward": FunctionSpec(
+        template=FMHA_BACKWARD_INSTANCE_TEMPLATE,
+        fname=FMHA_BACKWARD_INSTANCE_FNAME,
+        bias_options=((True, False), (True, True), (False, False)),
+        headdims=(32, 64, 96, 128, 256),
+    ),
+}
 
-def create_infer_instances(instance_dir: Path, headdims: List) -> None:
-    for mode in ["batched", "grouped"]:
-        for dtype in ["fp16", "bf16"]:
-            for has_mask in [True, False]:
-                for has_bias in [True, False]:
-                    for has_dropout in [True, False]:
-                        for max_k in headdims:
-                            fname = FMHA_INFER_INSTANCE_FNAME.format(
-                                mode=mode,
-                                dtype_str=dtype,
-                                has_or_no_mask_str=BOOL_MAP_MASK[has_mask],
-                                has_or_no_bias_str=BOOL_MAP_BIAS[has_bias],
-                                has_or_no_dropout_str=BOOL_MAP_DROPOUT[has_dropout],
-                                max_k_str=INT_MAP_MAX_K[max_k],
-                            )
-                            infer_instance_inc = (
-                                FMHA_INFER_INSTANCE_TEMPLATE_INC.format(
-                                    mode=mode,
-                                    dtype_file=TYPE_FNAME_MAP[dtype],
-                                )
-                            )
-                            infer_instance = FMHA_INFER_INSTANCE_TEMPLATE.format(
-                                extern="",
-                                mode=mode,
-                                dtype=TYPE_CTYPE_MAP[dtype],
-                                has_mask=BOOL_MAP[has_mask],
-                                has_bias=BOOL_MAP[has_bias],
-                                has_dropout=BOOL_MAP[has_dropout],
-                                max_k=max_k,
-                                cap_mode=MODE_NAME_MAP[mode],
-                            )
-                            (instance_dir / fname).write_text(
-                                FMHA_COPYRIGHT_HEADER
-                                + infer_instance_inc
-                                + infer_instance
-                            )
-
-
-def create_infer_instances_ref(instance_dir: Path, headdims: List) -> None:
-    for mode in ["batched", "grouped"]:
-        for dtype in ["fp16", "bf16"]:
-            ref_fname = FMHA_INSTANCE_REF_FNAME.format(
-                mode=mode,
-                function="infer",
-                dtype=dtype,
-            )
-            ref_fname_path = instance_dir / ref_fname
-            infer_instance_inc = FMHA_INFER_INSTANCE_TEMPLATE_INC.format(
-                mode=mode,
-                dtype_file=TYPE_FNAME_MAP[dtype],
-            )
-            with open(ref_fname_path, "a") as file:
-                file.write(FMHA_COPYRIGHT_HEADER)
-                file.write(infer_instance_inc)
-                for max_k in headdims:
-                    for has_bias in [True, False]:
-                        for has_dropout in [True, False]:
-                            for has_mask in [True, False]:
-                                infer_instance = FMHA_INFER_INSTANCE_TEMPLATE.format(
-                                    extern="extern ",
-                                    mode=mode,
-                                    dtype=TYPE_CTYPE_MAP[dtype],
-                                    has_mask=BOOL_MAP[has_mask],
-                                    has_bias=BOOL_MAP[has_bias],
-                                    has_dropout=BOOL_MAP[has_dropout],
-                                    max_k=max_k,
-                                    cap_mode=MODE_NAME_MAP[mode],
-                                )
-                                file.write(infer_instance)
-
-
-def create_forward_instances(instance_dir: Path, headdims: List) -> None:
-    for mode in ["batched", "grouped"]:
-        for dtype in ["fp16", "bf16"]:
-            for has_mask in [True, False]:
-                for has_bias in [True, False]:
-                    for has_dropout in [True, False]:
-                        for max_k in headdims:
-                            fname = FMHA_FORWARD_INSTANCE_FNAME.format(
-                                mode=mode,
-                                dtype_str=dtype,
-                                has_or_no_mask_str=BOOL_MAP_MASK[has_mask],
-                                has_or_no_bias_str=BOOL_MAP_BIAS[has_bias],
-                                has_or_no_dropout_str=BOOL_MAP_DROPOUT[has_dropout],
-                                max_k_str=INT_MAP_MAX_K[max_k],
-                            )
-                            forward_instance_inc = (
-                                FMHA_FORWARD_INSTANCE_TEMPLATE_INC.format(
-                                    mode=mode,
-                                    dtype_file=TYPE_FNAME_MAP[dtype],
-                                )
-                            )
-                            forward_instance = FMHA_FORWARD_INSTANCE_TEMPLATE.format(
-                                extern="",
-                                mode=mode,
-                                dtype=TYPE_CTYPE_MAP[dtype],
-                                has_mask=BOOL_MAP[has_mask],
-                                has_bias=BOOL_MAP[has_bias],
-                                has_dropout=BOOL_MAP[has_dropout],
-                                max_k=max_k,
-                                cap_mode=MODE_NAME_MAP[mode],
-                            )
-                            (instance_dir / fname).write_text(
-                                FMHA_COPYRIGHT_HEADER
-                                + forward_instance_inc
-                                + forward_instance
-                            )
-
-
-def create_forward_instances_ref(instance_dir: Path, headdims: List) -> None:
-    for mode in ["batched", "grouped"]:
-        for dtype in ["fp16", "bf16"]:
-            ref_fname = FMHA_INSTANCE_REF_FNAME.format(
-                mode=mode,
-                function="forward",
-                dtype=dtype,
-            )
-            ref_fname_path = instance_dir / ref_fname
-            forward_instance_inc = FMHA_FORWARD_INSTANCE_TEMPLATE_INC.format(
+
+def write_if_changed(path: Path, content: str) -> None:
+    # keep the mtime of unchanged instances so that ninja won't rebuild them
+    if path.exists() and path.read_text() == content:
+        return
+    # write to a temporary file first so that an interrupted run never
+    # leaves a truncated instance behind
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(content)
+    os.replace(tmp_path, path)
+
+
+def create_instances(instance_dir: Path, function: str) -> Dict[Path, str]:
+    # each instantiation is formatted once, and used both for its instance
+    # file and for the extern declaration in the reference header
+    spec = FUNCTION_SPEC_MAP[function]
+    instance_files = {}
+    for mode, dtype in itertools.product(MODES, DTYPES):
+        ref_fname = FMHA_INSTANCE_REF_FNAME.format(
+            mode=mode,
+            function=function,
+            dtype=dtype,
+        )
+        instance_inc = FMHA_INSTANCE_TEMPLATE_INC.format(
+            mode=mode,
+            function=function,
+            dtype_file=TYPE_FNAME_MAP[dtype],
+        )
+        ref_parts = [FMHA_COPYRIGHT_HEADER, instance_inc]
+        for (
+            max_k,
+            (has_bias, has_bias_grad),
+            has_dropout,
+            has_mask,
+        ) in itertools.product(
+            spec.headdims, spec.bias_options, BOOL_OPTIONS, BOOL_OPTIONS
+        ):
+            fname = spec.fname.format(
                 mode=mode,
-                dtype_file=TYPE_FNAME_MAP[dtype],
+                function=function,
+                dtype_str=dtype,
+                has_or_no_mask_str=BOOL_MAP_MASK[has_mask],
+                has_or_no_bias_str=BOOL_MAP_BIAS[has_bias],
+                has_or_no_biasgrad_str=BOOL_MAP_BIASGRAD[has_bias_grad],
+                has_or_no_dropout_str=BOOL_MAP_DROPOUT[has_dropout],
+                max_k_str=INT_MAP_MAX_K[max_k],
             )
-            with open(ref_fname_path, "a") as file:
-                file.write(FMHA_COPYRIGHT_HEADER)
-                file.write(forward_instance_inc)
-                for max_k in headdims:
-                    for has_bias in [True, False]:
-                        for has_dropout in [True, False]:
-                            for has_mask in [True, False]:
-                                forward_instance = (
-                                    FMHA_FORWARD_INSTANCE_TEMPLATE.format(
-                                        extern="extern ",
-                                        mode=mode,
-                                        dtype=TYPE_CTYPE_MAP[dtype],
-                                        has_mask=BOOL_MAP[has_mask],
-                                        has_bias=BOOL_MAP[has_bias],
-                                        has_dropout=BOOL_MAP[has_dropout],
-                                        max_k=max_k,
-                                        cap_mode=MODE_NAME_MAP[mode],
-                                    )
-                                )
-                                file.write(forward_instance)
-
-
-def create_backward_instances(instance_dir: Path, headdims: List) -> None:
-    for mode in ["batched", "grouped"]:
-        for dtype in ["fp16", "bf16"]:
-            for has_mask in [True, False]:
-                for has_bias, has_bias_grad in [
-                    [True, False],
-                    [True, True],
-                    [False, False],
-                ]:
-                    for has_dropout in [True, False]:
-                        for max_k in headdims:
-                            fname = FMHA_BACKWARD_INSTANCE_FNAME.format(
-                                mode=mode,
-                                dtype_str=dtype,
-                                has_or_no_mask_str=BOOL_MAP_MASK[has_mask],
-                                has_or_no_bias_str=BOOL_MAP_BIAS[has_bias],
-                                has_or_no_biasgrad_str=BOOL_MAP_BIASGRAD[has_bias_grad],
-                                has_or_no_dropout_str=BOOL_MAP_DROPOUT[has_dropout],
-                                max_k_str=INT_MAP_MAX_K[max_k],
-                            )
-                            backward_instance_inc = (
-                                FMHA_BACKWARD_INSTANCE_TEMPLATE_INC.format(
-                                    mode=mode,
-                                    dtype_file=TYPE_FNAME_MAP[dtype],
-                                )
-                            )
-                            backward_instance = FMHA_BACKWARD_INSTANCE_TEMPLATE.format(
-                                extern="",
-                                mode=mode,
-                                dtype=TYPE_CTYPE_MAP[dtype],
-                                has_mask=BOOL_MAP[has_mask],
-                                has_bias=BOOL_MAP[has_bias],
-                                has_bias_grad=BOOL_MAP[has_bias_grad],
-                                has_dropout=BOOL_MAP[has_dropout],
-                                max_k=max_k,
-                                cap_mode=MODE_NAME_MAP[mode],
-                            )
-                            (instance_dir / fname).write_text(
-                                FMHA_COPYRIGHT_HEADER
-                                + backward_instance_inc
-                                + backward_instance
-                            )
-
-
-def create_backward_instances_ref(instance_dir: Path, headdims: List) -> None:
-    for mode in ["batched", "grouped"]:
-        for dtype in ["fp16", "bf16"]:
-            ref_fname = FMHA_INSTANCE_REF_FNAME.format(
+            instance = spec.template.format(
+                visibility=FMHA_INSTANCE_VISIBILITY,
                 mode=mode,
-                function="backward",
-                dtype=dtype,
+                function=function,
+                dtype=TYPE_CTYPE_MAP[dtype],
+                has_mask=BOOL_MAP[has_mask],
+                has_bias=BOOL_MAP[has_bias],
+                has_bias_grad=BOOL_MAP[has_bias_grad],
+                has_dropout=BOOL_MAP[has_dropout],
+                max_k=max_k,
+                cap_mode=MODE_NAME_MAP[mode],
             )
-            ref_fname_path = instance_dir / ref_fname
-            backward_instance_inc = FMHA_BACKWARD_INSTANCE_TEMPLATE_INC.format(
-                mode=mode,
-                dtype_file=TYPE_FNAME_MAP[dtype],
+            instance_files[instance_dir / fname] = (
+                FMHA_COPYRIGHT_HEADER + instance_inc + "\n" + instance
             )
-            with open(ref_fname_path, "a") as file:
-                file.write(FMHA_COPYRIGHT_HEADER)
-                file.write(backward_instance_inc)
-                for max_k in headdims:
-                    for has_bias, has_bias_grad in [
-                        [True, False],
-                        [True, True],
-                        [False, False],
-                    ]:
-                        for has_dropout in [True, False]:
-                            for has_mask in [True, False]:
-                                backward_instance = (
-                                    FMHA_BACKWARD_INSTANCE_TEMPLATE.format(
-                                        extern="extern ",
-                                        mode=mode,
-                                        dtype=TYPE_CTYPE_MAP[dtype],
-                                        has_mask=BOOL_MAP[has_mask],
-                                        has_bias=BOOL_MAP[has_bias],
-                                        has_bias_grad=BOOL_MAP[has_bias_grad],
-                                        has_dropout=BOOL_MAP[has_dropout],
-                                        max_k=max_k,
-                                        cap_mode=MODE_NAME_MAP[mode],
-                                    )
-                                )
-                                file.write(backward_instance)
+            ref_parts.append("\nextern " + instance)
+        instance_files[instance_dir / ref_fname] = "".join(ref_parts)
+    return instance_files
 
 
 if __name__ == "__main__":
-    headdims_fwd = [32, 64, 96, 128, 256, 512]
-    headdims_bwd = [32, 64, 96, 128, 256]
+    for function, spec in FUNCTION_SPEC_MAP.items():
+        assert spec.headdims, f"no head-dim to instantiate for {function}"
+        unknown = set(spec.headdims) - set(INT_MAP_MAX_K)
+        assert not unknown, f"unknown head-dims for {function}: {sorted(unknown)}"
 
     this_dir = os.path.dirname(__file__)
     output_dir = Path(this_dir) / "instances"
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # remove existing files in the directory
-    files = os.listdir(output_dir)
-    for ff in files:
-        file_path = os.path.join(output_dir, ff)
-        os.remove(file_path)
-
-    create_infer_instances(output_dir, headdims_fwd)
-    create_infer_instances_ref(output_dir, headdims_fwd)
-    create_forward_instances(output_dir, headdims_fwd)
-    create_forward_instances_ref(output_dir, headdims_fwd)
-    create_backward_instances(output_dir, headdims_bwd)
-    create_backward_instances_ref(output_dir, headdims_bwd)
+    instance_files = {}
+    for function in FUNCTION_SPEC_MAP:
+        instance_files.update(create_instances(output_dir, function))
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 2)) as pool:
+        # consume the results so that exceptions from the workers are raised
+        list(pool.map(write_if_changed, instance_files.keys(), instance_files.values()))
+
+    # remove the files which are not generated any more, the unchanged
+    # ones are kept so that their timestamps are not touched. Only the files
+    # owned by this script are considered, the .cu copies which setup.py
+    # creates next to the instances are left alone
+    owned_files = {
+        file_path
+        for pattern in ["fmha_*.cpp", "*_instances_ref.h", "*.tmp"]
+        for file_path in output_dir.glob(pattern)
+    }
+    for file_path in owned_files - set(instance_files):
+        file_path.unlink()
@@ -13,7 +13,7 @@
 #include <ck_tile/core/numeric/bfloat16.hpp>
 #include "ck_tiled_fmha_batched_backward.h"
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     true,
     true,
@@ -21,7 +21,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     true,
     32>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     true,
@@ -29,7 +29,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     true,
     32>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     true,
     true,
@@ -37,7 +37,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     false,
     32>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     true,
@@ -45,7 +45,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     false,
     32>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     true,
     true,
@@ -53,7 +53,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     true,
     32>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     true,
@@ -61,7 +61,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     true,
     32>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     true,
     true,
@@ -69,7 +69,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     false,
     32>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     true,
@@ -77,7 +77,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     false,
     32>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     true,
     false,
@@ -85,7 +85,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     true,
     32>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     false,
@@ -93,7 +93,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     true,
     32>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     true,
     false,
@@ -101,7 +101,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     false,
     32>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     false,
@@ -109,7 +109,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     false,
     32>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     true,
     true,
@@ -117,7 +117,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     true,
     64>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     true,
@@ -125,7 +125,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     true,
     64>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     true,
     true,
@@ -133,7 +133,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     false,
     64>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     true,
@@ -141,7 +141,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     false,
     64>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     true,
     true,
@@ -149,7 +149,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     true,
     64>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     true,
@@ -157,7 +157,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     true,
     64>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     true,
     true,
@@ -165,7 +165,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     false,
     64>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     true,
@@ -173,7 +173,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     false,
     64>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     true,
     false,
@@ -181,7 +181,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     true,
     64>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     false,
@@ -189,7 +189,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     true,
     64>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     true,
     false,
@@ -197,7 +197,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     false,
     64>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     false,
@@ -205,7 +205,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     false,
     64>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     true,
     true,
@@ -213,7 +213,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     true,
     96>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     true,
@@ -221,7 +221,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     true,
     96>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     true,
     true,
@@ -229,7 +229,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     false,
     96>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     true,
@@ -237,7 +237,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     false,
     96>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     true,
     true,
@@ -245,7 +245,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     true,
     96>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     true,
@@ -253,7 +253,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     true,
     96>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     true,
     true,
@@ -261,7 +261,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     false,
     96>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     true,
@@ -269,7 +269,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     false,
     96>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     true,
     false,
@@ -277,7 +277,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     true,
     96>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     false,
@@ -285,7 +285,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     true,
     96>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     true,
     false,
@@ -293,7 +293,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     false,
     96>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     false,
@@ -301,7 +301,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     false,
     96>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     true,
     true,
@@ -309,7 +309,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     true,
     128>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     true,
@@ -317,7 +317,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     true,
     128>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     true,
     true,
@@ -325,7 +325,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     false,
     128>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     true,
@@ -333,7 +333,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     false,
     128>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     true,
     true,
@@ -341,7 +341,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     true,
     128>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     true,
@@ -349,7 +349,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     true,
     128>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     true,
     true,
@@ -357,7 +357,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     false,
     128>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     true,
@@ -365,7 +365,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     false,
     128>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     true,
     false,
@@ -373,7 +373,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     true,
     128>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     false,
@@ -381,7 +381,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     true,
     128>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     true,
     false,
@@ -389,7 +389,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     false,
     128>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     false,
@@ -397,7 +397,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     false,
     128>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     true,
     true,
@@ -405,7 +405,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     true,
     256>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     true,
@@ -413,7 +413,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     true,
     256>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     true,
     true,
@@ -421,7 +421,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     false,
     256>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     true,
@@ -429,7 +429,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     false,
     256>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     true,
     true,
@@ -437,7 +437,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     true,
     256>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     true,
@@ -445,7 +445,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     true,
     256>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     true,
     true,
@@ -453,7 +453,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     false,
     256>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     true,
@@ -461,7 +461,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     false,
     256>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     true,
     false,
@@ -469,7 +469,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     true,
     256>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     false,
@@ -477,7 +477,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     true,
     256>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     true,
     false,
@@ -485,7 +485,7 @@ extern template void run_batched_backward_mask_bias_dropout_dispatch<
     false,
     256>(BatchedBackwardParams& param, hipStream_t stream);
 
-extern template void run_batched_backward_mask_bias_dropout_dispatch<
+extern template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     false,
@@ -13,7 +13,7 @@
 #include <ck_tile/core/numeric/bfloat16.hpp>
 #include "ck_tiled_fmha_batched_backward.h"
 
-template void run_batched_backward_mask_bias_dropout_dispatch<
+template __attribute__((visibility("hidden"))) void run_batched_backward_mask_bias_dropout_dispatch<
     ck_tile::bf16_t,
     false,
     true,
@@ -13,7 +13,7 @@
 #include <ck_tile/core/numeric/half.hpp>
 #include "ck_tiled_fmha_batched_infer.h"
 
-template void run_batched_infer_mask_bias_dropout_dispatch<
+template __attribute__((visibility("hidden"))) void run_batched_infer_mask_bias_dropout_dispatch<
     ck_tile::fp16_t,
     true,
     true,